@@ -13,17 +13,29 @@ Użycie:
 
 import logging
 import time
-import json
 import re
 import argparse
+import functools
+import heapq
+import io
 import os
+import pickle
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
-from urllib.parse import urljoin
+from operator import attrgetter
+from typing import List, Dict, Optional, Tuple
+from urllib.parse import urljoin, urlsplit
+from zoneinfo import ZoneInfo
 
-import pytz
+import orjson
 import requests
-from bs4 import BeautifulSoup
+import requests_cache
+from requests.adapters import HTTPAdapter
+from bs4 import BeautifulSoup, SoupStrainer
+from lxml import etree
+from lxml import html as lxml_html
 
 # --------------------------------------------------------------------
 # KONFIGURACJA
@@ -31,7 +43,7 @@ from bs4 import BeautifulSoup
 
 SLEEP_BETWEEN_REQUESTS = 2.5
 HOURS_BACK = 24
-TZ_WARSAW = pytz.timezone("Europe/Warsaw")
+TZ_WARSAW = ZoneInfo("Europe/Warsaw")
 
 HEADERS = {
     "User-Agent": (
@@ -41,55 +53,152 @@ HEADERS = {
     ),
     "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
     "Accept-Language": "pl-PL,pl;q=0.9,en-US;q=0.8,en;q=0.7",
-    "Connection": "close",
 }
 
-# Konfiguracja źródeł
+# Katalog na cache HTTP i wyniki parsowania (zachowywany między uruchomieniami)
+CACHE_DIR = ".cache"
+PARSED_CACHE_FILE = os.path.join(CACHE_DIR, "parsed-articles.pkl")
+# Wersja parserów i formatu Article - podbij przy każdej zmianie wyniku
+# parsowania, wtedy wpisy w cache parsowania przestają pasować
+PARSER_VERSION = 1
+
+# Wspólna sesja HTTP tworzona przy pierwszym pobraniu (patrz get_session)
+_SESSION: Optional[requests_cache.CachedSession] = None
+_SESSION_LOCK = threading.Lock()
+
+
+def page_url_suffix(base: str, page: int) -> str:
+    """Bankier: /wiadomosc/, /wiadomosc/2, /wiadomosc/3, ..."""
+    return base if page == 1 else f"{base}{page}"
+
+
+def page_url_query(base: str, page: int) -> str:
+    """PAP: /depesze-pap, /depesze-pap?page=2, ..."""
+    return base if page == 1 else f"{base}?page={page}"
+
+
+# Konfiguracja źródeł: (adres działu, liczba stron, parser, adres n-tej strony)
 SOURCES = {
     "bankier": {
         "name": "Bankier.pl",
         "base_url": "https://www.bankier.pl",
         "urls": [
-            ("https://www.bankier.pl/wiadomosc/", 5, "bankier_news"),
-            ("https://www.bankier.pl/gielda/wiadomosci/", 5, "bankier_gielda"),
+            ("https://www.bankier.pl/wiadomosc/", 5, "bankier_news", page_url_suffix),
+            ("https://www.bankier.pl/gielda/wiadomosci/", 5, "bankier_gielda", page_url_suffix),
         ],
     },
     "pap": {
         "name": "PAP Biznes",
         "base_url": "https://biznes.pap.pl",
         "urls": [
-            ("https://biznes.pap.pl/kategoria/depesze-pap", 10, "pap"),
+            ("https://biznes.pap.pl/kategoria/depesze-pap", 10, "pap", page_url_query),
         ],
     },
 }
 
+# "2026-02-09 22:14 Tytuł" - format linków na stronie giełdowej Bankiera
+_GIELDA_RE = re.compile(r"^(\d{4}-\d{2}-\d{2} \d{2}:\d{2})\s+(.+)$")
+_WS = re.compile(r"\s+")
+
+# Z listy Bankiera parsujemy tylko sekcję artykułów - bez nawigacji, stopek i skryptów
+_BANKIER_STRAINER = SoupStrainer("section", id="articleList")
+
+# XPath-y strony PAP - kompilowane raz, każde wywołanie to jedno przejście w C
+_CLASS = "contains(concat(' ', normalize-space(@class), ' '), ' %s ')"
+_PAP_ROWS = etree.XPath("//li[contains(@class, 'news') and contains(@class, 'col-12')]")
+_PAP_WRAPPER = etree.XPath(f"(.//div[{_CLASS % 'textWrapper'}])[1]")
+_PAP_DATE = etree.XPath(f"string(((.//div[{_CLASS % 'info'}])[1]//div[{_CLASS % 'date'}])[1])")
+_PAP_LINK = etree.XPath("(.//a[contains(@href, '/wiadomosci/')])[1]")
+_PAP_TITLE = etree.XPath(f"(.//h3[{_CLASS % 'title'}])[1]")
+_PAP_TEASER = etree.XPath("(.//p[contains(@class, 'field--name-field-lead')])[1]")
+
 # Nazwa pliku wyjściowego
 OUTPUT_FILENAME = "combined-feed.json"
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
 
+# --------------------------------------------------------------------
+# ARTYKUŁ
+# --------------------------------------------------------------------
+
+@dataclass(slots=True, frozen=True)
+class Article:
+    title: str
+    link: str
+    pub_date: datetime
+    teaser: str
+    source: str
+
 # --------------------------------------------------------------------
 # FUNKCJE POMOCNICZE
 # --------------------------------------------------------------------
 
-def fetch_page_html(url: str) -> Optional[str]:
+def get_session() -> requests_cache.CachedSession:
+    """Sesja HTTP z keep-alive, pulą połączeń i cache odpowiedzi.
+
+    Kolejne strony z tego samego hosta nie wymagają nowego połączenia TCP/TLS,
+    a odpowiedzi są rewalidowane przez ETag/Last-Modified (304 zamiast pobierania).
+    Tworzona dopiero przy pierwszym użyciu, więc import modułu (także w procesach
+    puli parsującej) nie zakłada pliku cache.
+    """
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            session = requests_cache.CachedSession(
+                os.path.join(CACHE_DIR, "rss_http_cache"),
+                backend="sqlite",
+                expire_after=300,
+                cache_control=True,
+            )
+            session.headers.update(HEADERS)
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _SESSION = session
+    return _SESSION
+
+
+def fetch_page(url: str) -> Optional[requests.Response]:
     logging.info("Pobieram: %s", url)
     try:
-        resp = requests.get(url, headers=HEADERS, timeout=15)
+        resp = get_session().get(url, timeout=15)
         resp.raise_for_status()
-        return resp.text
+        return resp
     except Exception as exc:
         logging.error("Błąd pobierania %s: %s", url, exc)
         return None
-    finally:
-        time.sleep(SLEEP_BETWEEN_REQUESTS)
+
+
+def _clean(text: str) -> str:
+    """Zwija białe znaki do pojedynczych spacji."""
+    return _WS.sub(" ", text).strip()
+
+
+@functools.lru_cache(maxsize=4096)
+def _join(base: str, href: str) -> str:
+    return urljoin(base, href)
+
+
+def _canon(url: str) -> int:
+    """Klucz deduplikacji linku - bez query (np. utm_*), fragmentu i końcowego "/"."""
+    parts = urlsplit(url)
+    return hash((parts.scheme, parts.netloc.lower(), parts.path.rstrip("/")))
+
+
+def load_cache(path: str) -> Dict:
+    """Wczytuje słownik zapisany w pliku cache; brak lub uszkodzony plik = pusty."""
+    try:
+        with open(path, "rb") as f:
+            return pickle.load(f)
+    except Exception:
+        return {}
 
 # --------------------------------------------------------------------
 # PARSERY
 # --------------------------------------------------------------------
 
-def parse_bankier_news(html: str, base_url: str) -> List[Dict]:
-    soup = BeautifulSoup(html, "html.parser")
+def parse_bankier_news(html: str, base_url: str) -> List[Article]:
+    soup = BeautifulSoup(html, "lxml", parse_only=_BANKIER_STRAINER)
     section = soup.find("section", id="articleList")
     if not section:
         return []
@@ -107,8 +216,8 @@ def parse_bankier_news(html: str, base_url: str) -> List[Dict]:
             if not a_tag or not a_tag.get("href"):
                 continue
 
-            title = " ".join(a_tag.get_text(strip=True).split())
-            link = urljoin(base_url, a_tag["href"])
+            title = _clean(a_tag.get_text(strip=True))
+            link = _join(base_url, a_tag["href"])
 
             meta_div = content.find("div", class_="entry-meta")
             if not meta_div:
@@ -120,7 +229,7 @@ def parse_bankier_news(html: str, base_url: str) -> List[Dict]:
             dt_str = time_tags[-1].get("datetime") or time_tags[-1].get_text(strip=True)
             pub_dt = datetime.fromisoformat(dt_str)
             if pub_dt.tzinfo is None:
-                pub_dt = TZ_WARSAW.localize(pub_dt)
+                pub_dt = pub_dt.replace(tzinfo=TZ_WARSAW)
             else:
                 pub_dt = pub_dt.astimezone(TZ_WARSAW)
 
@@ -129,102 +238,127 @@ def parse_bankier_news(html: str, base_url: str) -> List[Dict]:
             if teaser_tag:
                 for more_link in teaser_tag.find_all("a", class_="more-link"):
                     more_link.decompose()
-                teaser = " ".join(teaser_tag.get_text(" ", strip=True).split())
+                teaser = _clean(teaser_tag.get_text(" ", strip=True))
 
-            articles.append({"title": title, "link": link, "pub_date": pub_dt, "teaser": teaser, "source": "Bankier.pl"})
+            articles.append(Article(title, link, pub_dt, teaser, "Bankier.pl"))
         except Exception:
             continue
     return articles
 
 
-def parse_bankier_gielda(html: str, base_url: str) -> List[Dict]:
-    soup = BeautifulSoup(html, "html.parser")
-    main = soup.find("main") or soup
+def parse_bankier_gielda(html: str, base_url: str) -> List[Article]:
+    # Strona giełdowa to setki linków - parsujemy ją strumieniowo i zwalniamy
+    # każdy <a> zaraz po przetworzeniu, zamiast budować całe drzewo dokumentu
+    context = etree.iterparse(
+        io.BytesIO(html.encode("utf-8")),
+        events=("start", "end"),
+        tag=("main", "a"),
+        html=True,
+        encoding="utf-8",
+    )
+    # Jak wcześniej: linki z pierwszego <main>, a gdy go brak - z całej strony
     articles = []
-    pattern = re.compile(r"^(\d{4}-\d{2}-\d{2} \d{2}:\d{2})\s+(.+)$")
+    main_articles = []
+    in_main = saw_main = False
+    # Lokalne aliasy - pętla wykonuje się dla każdego linku na stronie
+    match = _GIELDA_RE.match
+    strptime = datetime.strptime
+    tz = TZ_WARSAW
+    join = _join
 
-    for a in main.find_all("a", href=True):
-        text = " ".join(a.get_text(" ", strip=True).split())
-        m = pattern.match(text)
-        if not m:
-            continue
-        dt_str, title = m.groups()
-        try:
-            dt_naive = datetime.strptime(dt_str, "%Y-%m-%d %H:%M")
-        except ValueError:
-            continue
-        pub_dt = TZ_WARSAW.localize(dt_naive)
-        link = urljoin(base_url, a["href"])
-        articles.append({"title": title, "link": link, "pub_date": pub_dt, "teaser": "", "source": "Bankier.pl"})
-    return articles
+    try:
+        for event, elem in context:
+            if elem.tag == "main":
+                if event == "start" and not saw_main:
+                    in_main = saw_main = True
+                elif event == "end":
+                    in_main = False
+                continue
+            if event != "end":
+                continue
 
+            href = elem.get("href")
+            text = _clean(" ".join(elem.itertext()))
+            elem.clear()
+            parent = elem.getparent()
+            if parent is not None:
+                parent.remove(elem)
+            if href is None:
+                continue
 
-def parse_pap(html: str, base_url: str) -> List[Dict]:
-    soup = BeautifulSoup(html, "html.parser")
+            m = match(text)
+            if not m:
+                continue
+            dt_str, title = m.groups()
+            try:
+                dt_naive = strptime(dt_str, "%Y-%m-%d %H:%M")
+            except ValueError:
+                continue
+            pub_dt = dt_naive.replace(tzinfo=tz)
+            link = join(base_url, href)
+            art = Article(title, link, pub_dt, "", "Bankier.pl")
+            articles.append(art)
+            if in_main:
+                main_articles.append(art)
+    except etree.XMLSyntaxError as exc:
+        logging.warning("Błąd parsowania strony giełdowej: %s", exc)
+
+    return main_articles if saw_main else articles
+
+
+def parse_pap(html: str, base_url: str) -> List[Article]:
+    try:
+        root = lxml_html.fromstring(html)
+    except (etree.ParserError, ValueError) as exc:
+        logging.warning("Błąd parsowania strony PAP: %s", exc)
+        return []
     articles = []
     now = datetime.now(TZ_WARSAW)
-    
+    strptime = datetime.strptime
+    tz = TZ_WARSAW
+    join = _join
+
     # Szukamy <li> z klasą "news" i "col-12"
-    for li in soup.find_all("li", class_=lambda x: x and "news" in x and "col-12" in x):
+    for li in _PAP_ROWS(root):
         # Szukamy <div class="textWrapper">
-        wrapper = li.find("div", class_="textWrapper")
+        wrapper = _PAP_WRAPPER(li)
         if not wrapper:
             continue
-        
-        # Szukamy daty w <div class="info"> > <div class="date">
-        info_div = wrapper.find("div", class_="info")
+        wrapper = wrapper[0]
+
+        # Data w <div class="info"> > <div class="date">, format: "2026-02-09 22:14"
         pub_dt = now
-        
-        if info_div:
-            date_div = info_div.find("div", class_="date")
-            if date_div:
-                date_text = date_div.get_text(strip=True)
-                try:
-                    # Format: "2026-02-09 22:14"
-                    dt_naive = datetime.strptime(date_text, "%Y-%m-%d %H:%M")
-                    pub_dt = TZ_WARSAW.localize(dt_naive)
-                except ValueError:
-                    pass
-        
-        # Link do artykułu jest POZA <div class="info"> - w <div class="textWrapper">
-        # Szukamy <a> z href zawierającym /wiadomosci/
-        article_link = None
-        for a_tag in wrapper.find_all("a", href=True):
-            href = a_tag.get("href", "")
-            if "/wiadomosci/" in href:
-                article_link = a_tag
-                break
-        
+        date_text = _PAP_DATE(wrapper).strip()
+        if date_text:
+            try:
+                pub_dt = strptime(date_text, "%Y-%m-%d %H:%M").replace(tzinfo=tz)
+            except ValueError:
+                pass
+
+        # Link do artykułu jest POZA <div class="info"> - w <div class="textWrapper">,
+        # to pierwszy <a> z href zawierającym /wiadomosci/
+        article_link = _PAP_LINK(wrapper)
         if not article_link:
             continue
-        
-        href = article_link.get("href", "")
-        link = urljoin(base_url, href)
-        
+        article_link = article_link[0]
+        link = join(base_url, article_link.get("href"))
+
         # Tytuł może być w <h3 class="title"> lub bezpośrednio w <a>
-        title_elem = article_link.find("h3", class_="title")
-        if title_elem:
-            title = " ".join(title_elem.get_text(strip=True).split())
-        else:
-            title = " ".join(article_link.get_text(strip=True).split())
-        
+        title_elem = _PAP_TITLE(article_link)
+        title_elem = title_elem[0] if title_elem else article_link
+        title = _clean(title_elem.text_content())
+
         if not title or len(title) < 10:
             continue
-        
+
         # Teaser w <p class="field--name-field-lead">
         teaser = ""
-        p_tag = wrapper.find("p", class_=lambda x: x and "field--name-field-lead" in x)
+        p_tag = _PAP_TEASER(wrapper)
         if p_tag:
-            teaser = " ".join(p_tag.get_text(strip=True).split())[:200]
-        
-        articles.append({
-            "title": title, 
-            "link": link, 
-            "pub_date": pub_dt, 
-            "teaser": teaser, 
-            "source": "PAP Biznes"
-        })
-    
+            teaser = _clean(p_tag[0].text_content())[:200]
+
+        articles.append(Article(title, link, pub_dt, teaser, "PAP Biznes"))
+
     return articles
 
 
@@ -238,38 +372,90 @@ PARSERS = {
 # ZBIERANIE ARTYKUŁÓW
 # --------------------------------------------------------------------
 
-def collect_articles(source_key: str) -> List[Dict]:
-    """Zbiera artykuły z danego źródła (może mieć wiele URL-i)."""
+def fetch_source(source_key: str) -> List[Tuple[str, str, requests.Response]]:
+    """Pobiera kolejno wszystkie strony danego źródła: [(url, parser, odpowiedź)]."""
     config = SOURCES[source_key]
-    base_url = config["base_url"]
-    
+    pages = []
+    # Odstęp liczony od poprzedniego zapytania do tego samego hosta
+    next_request_at = 0.0
+
+    for section_url, num_pages, parser_name, page_url_fn in config["urls"]:
+        for page in range(1, num_pages + 1):
+            url = page_url_fn(section_url, page)
+
+            delay = next_request_at - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            resp = fetch_page(url)
+            next_request_at = time.monotonic() + SLEEP_BETWEEN_REQUESTS
+            if resp is None or not resp.text:
+                continue
+            pages.append((url, parser_name, resp))
+
+    return pages
+
+
+def _dispatch_parse(job: Tuple[str, str, str]) -> List[Article]:
+    html, parser_name, base_url = job
+    return PARSERS[parser_name](html, base_url)
+
+
+def parse_pages(fetched: Dict[str, List[Tuple[str, str, requests.Response]]]) -> Dict[str, List[List[Article]]]:
+    """Parsuje pobrane strony wszystkich źródeł w puli procesów.
+
+    Strony niezmienione od poprzedniego uruchomienia (ten sam ETag lub
+    Last-Modified w odpowiedzi z cache) biorą wynik z cache i omijają pulę.
+    """
+    # {url: (PARSER_VERSION, ETag lub Last-Modified, artykuły)}
+    parsed_cache = load_cache(PARSED_CACHE_FILE)
+    # Jedno miejsce na stronę - kolejność działów i stron jak przy pobieraniu,
+    # niezależnie od tego, które strony przyszły z cache
+    results = {source_key: [None] * len(pages) for source_key, pages in fetched.items()}
+    jobs = []
+    pending = []
+
+    for source_key, pages in fetched.items():
+        base_url = SOURCES[source_key]["base_url"]
+        for index, (url, parser_name, resp) in enumerate(pages):
+            validator = resp.headers.get("ETag") or resp.headers.get("Last-Modified")
+            cached = parsed_cache.get(url)
+            if validator and resp.from_cache and cached and cached[:2] == (PARSER_VERSION, validator):
+                results[source_key][index] = cached[2]
+                continue
+            jobs.append((resp.text, parser_name, base_url))
+            pending.append((source_key, index, url, validator))
+
+    if jobs:
+        # Parsery to czyste funkcje (html, base_url) - każda strona osobno, poza GIL
+        with ProcessPoolExecutor(max_workers=min(len(jobs), os.cpu_count() or 1)) as pool:
+            for (source_key, index, url, validator), articles in zip(pending, pool.map(_dispatch_parse, jobs)):
+                results[source_key][index] = articles
+                if validator:
+                    parsed_cache[url] = (PARSER_VERSION, validator, articles)
+
+    with open(PARSED_CACHE_FILE, "wb") as f:
+        pickle.dump(parsed_cache, f)
+    return results
+
+
+def collect_articles(source_key: str, parsed_pages: List[List[Article]]) -> List[Article]:
+    """Łączy artykuły ze stron danego źródła - bez duplikatów i starszych niż HOURS_BACK."""
     all_articles = []
     seen_links = set()
     now = datetime.now(TZ_WARSAW)
     cutoff = now - timedelta(hours=HOURS_BACK)
 
-    for section_url, num_pages, parser_name in config["urls"]:
-        parser = PARSERS[parser_name]
-        
-        for page in range(1, num_pages + 1):
-            if "pap" in parser_name:
-                url = section_url if page == 1 else f"{section_url}?page={page}"
-            else:
-                url = section_url if page == 1 else f"{section_url}{page}"
-
-            html = fetch_page_html(url)
-            if not html:
+    for page_articles in parsed_pages:
+        for art in page_articles:
+            key = _canon(art.link)
+            if key in seen_links:
                 continue
+            if art.pub_date < cutoff:
+                continue
+            seen_links.add(key)
+            all_articles.append(art)
 
-            for art in parser(html, base_url):
-                if art["link"] in seen_links:
-                    continue
-                if art["pub_date"] < cutoff:
-                    continue
-                seen_links.add(art["link"])
-                all_articles.append(art)
-
-    all_articles.sort(key=lambda x: x["pub_date"], reverse=True)
+    all_articles.sort(key=attrgetter("pub_date"), reverse=True)
     logging.info("[%s] Znaleziono %d artykułów (bez duplikatów)", source_key, len(all_articles))
     return all_articles
 
@@ -277,25 +463,25 @@ def collect_articles(source_key: str) -> List[Dict]:
 # GENERATOR JSON
 # --------------------------------------------------------------------
 
-def generate_combined_json(all_articles: List[Dict]) -> str:
-    """Generuje jeden plik JSON z artykułami ze wszystkich źródeł."""
-    return json.dumps({
+def build_feed_dict(all_articles: List[Article]) -> Dict:
+    """Buduje JSON Feed z artykułami ze wszystkich źródeł (daty jako datetime)."""
+    return {
         "version": "https://jsonfeed.org/version/1",
         "title": "Wiadomości Finansowe - Bankier.pl + PAP Biznes",
         "description": f"Połączone wiadomości z wielu źródeł (ostatnie {HOURS_BACK}h)",
         "home_page_url": "https://www.bankier.pl",
         "items": [
             {
-                "id": a["link"], 
-                "url": a["link"], 
-                "title": a["title"],
-                "content_html": a["teaser"], 
-                "date_published": a["pub_date"].isoformat(),
-                "source": a["source"]
+                "id": a.link, 
+                "url": a.link, 
+                "title": a.title,
+                "content_html": a.teaser, 
+                "date_published": a.pub_date,
+                "source": a.source
             }
             for a in all_articles
         ],
-    }, ensure_ascii=False, indent=2)
+    }
 
 # --------------------------------------------------------------------
 # MAIN
@@ -307,29 +493,39 @@ def main():
     args = parser.parse_args()
 
     os.makedirs(args.output, exist_ok=True)
-
-    # Zbierz artykuły ze wszystkich źródeł
+    os.makedirs(CACHE_DIR, exist_ok=True)
+
+    # Każde źródło to osobny host - pobieramy je równolegle, a w obrębie
+    # jednego hosta zapytania idą kolejno z odstępem SLEEP_BETWEEN_REQUESTS
+    with ThreadPoolExecutor(max_workers=len(SOURCES)) as pool:
+        fetched = dict(zip(SOURCES, pool.map(fetch_source, SOURCES)))
+
+    # Parsowanie dopiero po zakończeniu pobierania - pula procesów startuje,
+    # gdy nie działają już wątki pobierające
+    parsed = parse_pages(fetched)
+
+    # Listy ze źródeł są już posortowane malejąco po dacie - scalamy je
+    # w jednym przejściu (bez ponownego sortowania) i od razu usuwamy duplikaty
+    merged = heapq.merge(
+        *(collect_articles(source_key, parsed[source_key]) for source_key in SOURCES),
+        key=attrgetter("pub_date"),
+        reverse=True,
+    )
     all_articles = []
     seen_links = set()
-    
-    for source_key in SOURCES.keys():
-        articles = collect_articles(source_key)
-        
-        # Dodaj tylko unikalne artykuły
-        for art in articles:
-            if art["link"] not in seen_links:
-                all_articles.append(art)
-                seen_links.add(art["link"])
-    
-    # Sortuj wszystkie artykuły chronologicznie
-    all_articles.sort(key=lambda x: x["pub_date"], reverse=True)
-    
+    for art in merged:
+        key = _canon(art.link)
+        if key not in seen_links:
+            all_articles.append(art)
+            seen_links.add(key)
+
     logging.info("Łącznie znaleziono %d unikalnych artykułów ze wszystkich źródeł", len(all_articles))
     
-    # Zapisz jeden plik JSON
+    # Zapisz jeden plik JSON - orjson od razu daje bajty UTF-8 i serializuje
+    # datetime ze strefą czasową natywnie (RFC 3339)
     json_path = os.path.join(args.output, OUTPUT_FILENAME)
-    with open(json_path, "w", encoding="utf-8") as f:
-        f.write(generate_combined_json(all_articles))
+    with open(json_path, "wb") as f:
+        f.write(orjson.dumps(build_feed_dict(all_articles), option=orjson.OPT_INDENT_2))
     
     logging.info("Zapisano: %s", json_path)
     logging.info("Gotowe!")